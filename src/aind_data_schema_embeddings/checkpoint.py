@@ -0,0 +1,175 @@
+"""Durable checkpoint journal for resumable ingestion runs"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+STARTED = "started"
+BATCH_WRITTEN = "batch_written"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+@dataclass
+class FileCheckpoint:
+    """Latest confirmed progress of a single file"""
+
+    file_key: str
+    file_path: str
+    fingerprint: str
+    stage: str = STARTED
+    batches_written: int = 0
+    vectors_written: int = 0
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every vector of the file has been written"""
+        return self.stage == COMPLETED
+
+
+@dataclass
+class RunSummary:
+    """Counts of resumed work against fresh work for one run"""
+
+    fresh_files: int = 0
+    resumed_files: int = 0
+    skipped_files: int = 0
+    failed_files: int = 0
+    fresh_batches: int = 0
+    resumed_batches: int = 0
+    reused_batches: int = 0
+    vectors_written: int = 0
+
+    def record_batch(self, resumed: bool, vectors_written: int) -> None:
+        """Count a batch that was embedded and written in this run"""
+        if resumed:
+            self.resumed_batches += 1
+        else:
+            self.fresh_batches += 1
+        self.vectors_written += vectors_written
+
+    def report(self) -> str:
+        """Human readable run summary"""
+        return (
+            f"Files: {self.fresh_files} fresh, {self.resumed_files} resumed, "
+            f"{self.skipped_files} skipped, {self.failed_files} failed. "
+            f"Batches: {self.fresh_batches} fresh, "
+            f"{self.resumed_batches} resumed, "
+            f"{self.reused_batches} reused from checkpoints. "
+            f"Vectors written: {self.vectors_written}"
+        )
+
+
+class CheckpointJournal:
+    """Append-only journal of per-file, per-batch ingestion progress"""
+
+    def __init__(self, journal_path: str):
+        """Constructor"""
+        self.journal_path = Path(journal_path)
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.checkpoints: Dict[str, FileCheckpoint] = self.replay()
+
+    def replay(self) -> Dict[str, FileCheckpoint]:
+        """Rebuild the latest checkpoint of every file from the journal"""
+        checkpoints = {}
+        if not self.journal_path.exists():
+            return checkpoints
+
+        size = valid_size = 0
+        with open(self.journal_path, "rb") as file:
+            for line in file:
+                size += len(line)
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Record is missing its newline")
+                    record = json.loads(line)
+                except ValueError:
+                    logging.warning(f"Ignoring malformed record: {line!r}")
+                    continue
+                valid_size = size
+                checkpoints[record["file_key"]] = FileCheckpoint(
+                    file_key=record["file_key"],
+                    file_path=record["file_path"],
+                    fingerprint=record["fingerprint"],
+                    stage=record["stage"],
+                    batches_written=record["batches_written"],
+                    vectors_written=record["vectors_written"],
+                )
+
+        if valid_size < size:
+            # Cut off a torn final record so the next append starts on a
+            # fresh line instead of being swallowed by it
+            with open(self.journal_path, "r+b") as file:
+                file.truncate(valid_size)
+                os.fsync(file.fileno())
+        return checkpoints
+
+    def append(self, checkpoint: FileCheckpoint, **extra) -> None:
+        """Durably append the checkpoint's current state to the journal"""
+        record = {
+            **asdict(checkpoint),
+            **extra,
+            "run_id": self.run_id,
+            "timestamp": datetime.now().isoformat(),
+        }
+        with open(self.journal_path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def get(self, file_key: str) -> Optional[FileCheckpoint]:
+        """Latest checkpoint of a file, or None if it was never started"""
+        return self.checkpoints.get(file_key)
+
+    def incomplete_files(self) -> List[FileCheckpoint]:
+        """Checkpoints of files that were started but never completed"""
+        return [
+            checkpoint
+            for checkpoint in self.checkpoints.values()
+            if not checkpoint.is_complete
+        ]
+
+    def start_file(
+        self, file_key: str, file_path: str, fingerprint: str
+    ) -> FileCheckpoint:
+        """Begin or resume a file, keeping progress only if it is unchanged"""
+        checkpoint = self.checkpoints.get(file_key)
+        if checkpoint is None or checkpoint.fingerprint != fingerprint:
+            if checkpoint is not None:
+                logging.info(f"{file_key} changed, restarting from chunk 0")
+            checkpoint = FileCheckpoint(
+                file_key=file_key,
+                file_path=str(file_path),
+                fingerprint=fingerprint,
+            )
+            self.checkpoints[file_key] = checkpoint
+        checkpoint.stage = STARTED
+        self.append(checkpoint)
+        return checkpoint
+
+    def record_batch(self, file_key: str, vectors_written: int) -> None:
+        """Record a batch whose vectors were all confirmed written"""
+        checkpoint = self.checkpoints[file_key]
+        checkpoint.stage = BATCH_WRITTEN
+        checkpoint.batches_written += 1
+        checkpoint.vectors_written += vectors_written
+        self.append(checkpoint)
+
+    def complete_file(self, file_key: str) -> None:
+        """Mark a file as fully embedded"""
+        checkpoint = self.checkpoints[file_key]
+        checkpoint.stage = COMPLETED
+        self.append(checkpoint)
+
+    def fail_file(self, file_key: str, error: Exception) -> None:
+        """Mark a file as failed, keeping its confirmed progress"""
+        checkpoint = self.checkpoints.get(file_key)
+        if checkpoint is None:
+            return
+        checkpoint.stage = FAILED
+        self.append(checkpoint, error=str(error))
@@ -0,0 +1,68 @@
+"""Chunker protocol and registry keyed by file suffix and MIME type"""
+
+import mimetypes
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Protocol, Type
+
+SNIFF_SIZE = 1024
+
+CHUNKERS_BY_SUFFIX: Dict[str, Type["Chunker"]] = {}
+CHUNKERS_BY_MIME_TYPE: Dict[str, Type["Chunker"]] = {}
+
+
+class Chunker(Protocol):
+    """Interface every file chunker implements"""
+
+    # Bump whenever the chunks produced for a file change, so checkpoints
+    # from an older chunker are not resumed at the wrong offset
+    version: int
+
+    def __init__(self, file_path: str, file_name: str):
+        """Constructor"""
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Lazily yield text chunks ready to be embedded."""
+
+
+def register_chunker(
+    *suffixes: str, mime_types: tuple = ()
+) -> Callable[[Type[Chunker]], Type[Chunker]]:
+    """Class decorator registering a chunker for suffixes and MIME types"""
+
+    def decorator(chunker_class: Type[Chunker]) -> Type[Chunker]:
+        """Adds the chunker class to the registries"""
+        for suffix in suffixes:
+            CHUNKERS_BY_SUFFIX[suffix.lower()] = chunker_class
+        for mime_type in mime_types:
+            CHUNKERS_BY_MIME_TYPE[mime_type] = chunker_class
+        return chunker_class
+
+    return decorator
+
+
+def is_binary(file_path: Path) -> bool:
+    """Sniff the head of a file for NUL bytes or non UTF-8 content"""
+
+    with open(file_path, "rb") as file:
+        head = file.read(SNIFF_SIZE)
+    if b"\x00" in head:
+        return True
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A multi-byte character may be cut off at the sniff boundary
+        return len(head) < SNIFF_SIZE or e.start < len(head) - 3
+    return False
+
+
+def get_chunker(file_path: Path) -> Optional[Type[Chunker]]:
+    """Find the chunker for a file, or None if it should be skipped"""
+
+    file_path = Path(file_path)
+    chunker_class = CHUNKERS_BY_SUFFIX.get(file_path.suffix.lower())
+    if chunker_class is None:
+        mime_type, _ = mimetypes.guess_type(file_path.name)
+        chunker_class = CHUNKERS_BY_MIME_TYPE.get(mime_type)
+    if chunker_class is None or is_binary(file_path):
+        return None
+    return chunker_class
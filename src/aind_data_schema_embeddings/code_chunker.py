@@ -4,7 +4,9 @@ import ast
 import json
 import textwrap
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
+
+from aind_data_schema_embeddings.chunker import register_chunker
 
 
 @dataclass
@@ -19,9 +21,12 @@ class CodeChunk:
     docstring: Optional[str] = None
 
 
+@register_chunker(".py", mime_types=("text/x-python",))
 class PythonCodeChunker:
     """Code chunker class"""
 
+    version = 1
+
     def __init__(self, file_path: str, file_name: str):
         """Constructor"""
 
@@ -250,33 +255,33 @@ class PythonCodeChunker:
                 )
                 self.chunks.append(chunk)
 
-    def create_chunks(self) -> List[CodeChunk]:
-        """Create all chunks from the Python file."""
+    def iter_chunks(self) -> Iterator[str]:
+        """Lazily yield combined chunks from the Python file."""
 
         self.chunks = []
         self.process_imports()
         self.process_classes()
         self.process_standalone_functions()
 
-        combined_chunk_list = []
         curr_chunk = ""
-        chunk_size = 0
 
         for chunk in self.chunks:
-            #     print(type(chunk))
             chunk_str = json.dumps(chunk.__dict__)
 
-            chunk_size = len(curr_chunk)
-            chunk_to_add_size = len(chunk_str)
-
-            if chunk_size + chunk_to_add_size >= self.max_chunk_size:
-                combined_chunk_list.append(curr_chunk)
+            if (
+                curr_chunk
+                and len(curr_chunk) + len(chunk_str) >= self.max_chunk_size
+            ):
+                yield curr_chunk
                 curr_chunk = chunk_str
             else:
                 curr_chunk += chunk_str
 
-        # Append the last chunk if it has any content
+        # Yield the last chunk if it has any content
         if curr_chunk:
-            combined_chunk_list.append(curr_chunk)
+            yield curr_chunk
+
+    def create_chunks(self) -> List[str]:
+        """Create all chunks from the Python file."""
 
-        return combined_chunk_list
+        return list(self.iter_chunks())
@@ -1,8 +1,11 @@
 """Document chunker that preserves code structure and syntax"""
 
+import json
 import re
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
+
+from aind_data_schema_embeddings.chunker import register_chunker
 
 
 @dataclass
@@ -13,9 +16,12 @@ class DocumentChunk:
     content: str
 
 
+@register_chunker(".txt", mime_types=("text/plain",))
 class DocumentChunker:
     """Document chunker class"""
 
+    version = 1
+
     def __init__(self, file_path: str, file_name: str):
         """Constructor"""
         with open(file_path, "r", encoding="utf-8") as file:
@@ -70,10 +76,10 @@ class DocumentChunker:
                         chunks.append(chunk)
         return chunks
 
-    def merge_small_chunks(
-        self, chunks: List[DocumentChunk]
-    ) -> List[DocumentChunk]:
-        """Merge chunks that are too small."""
+    def iter_merged_chunks(
+        self, chunks: Iterable[DocumentChunk]
+    ) -> Iterator[DocumentChunk]:
+        """Lazily merge chunks that are too small."""
         current_chunk = None
 
         for chunk in chunks:
@@ -88,11 +94,23 @@ class DocumentChunker:
                 # Merge with next chunk
                 current_chunk.content += f"\n\n{chunk.content}"
             else:
-                self.chunks.append(current_chunk)
+                yield current_chunk
                 current_chunk = chunk
 
         if current_chunk:
-            self.chunks.append(current_chunk)
+            yield current_chunk
+
+    def merge_small_chunks(
+        self, chunks: List[DocumentChunk]
+    ) -> List[DocumentChunk]:
+        """Merge chunks that are too small."""
+        self.chunks.extend(self.iter_merged_chunks(chunks))
+        return self.chunks
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Lazily yield serialized chunks from document."""
+        for chunk in self.iter_merged_chunks(self.extract_sections()):
+            yield json.dumps(chunk.__dict__)
 
     def create_chunks(self) -> List[DocumentChunk]:
         """Create all chunks from document."""
@@ -100,3 +118,103 @@ class DocumentChunker:
         extracted_chunks = self.extract_sections()
         self.merge_small_chunks(extracted_chunks)
         return self.chunks
+
+
+@register_chunker(".md", ".markdown", mime_types=("text/markdown",))
+class MarkdownChunker(DocumentChunker):
+    """Markdown chunker splitting on ATX headings"""
+
+    def iter_merged_chunks(
+        self, chunks: Iterable[DocumentChunk]
+    ) -> Iterator[DocumentChunk]:
+        """Keep each heading section apart instead of merging them."""
+        yield from chunks
+
+    def split_large_section(self, section: str) -> Iterator[str]:
+        """Split an oversized section on paragraph boundaries."""
+        current = ""
+        for paragraph in re.split(r"\n\s*\n", section):
+            if current and (
+                len(current) + len(paragraph) + 2 > self.max_chunk_size
+            ):
+                yield current
+                current = paragraph
+            else:
+                current = (
+                    f"{current}\n\n{paragraph}" if current else paragraph
+                )
+        if current:
+            yield current
+
+    def iter_sections(self) -> Iterator[Tuple[str, List[str]]]:
+        """Yield the title and lines of each heading section."""
+        title, lines, fence = "", [], None
+
+        for line in self.content.split("\n"):
+            match = re.match(r" {0,3}(```|~~~)", line)
+            if match:
+                # Headings inside code fences are comments, not sections
+                if fence is None:
+                    fence = match.group(1)
+                elif match.group(1) == fence:
+                    fence = None
+            elif fence is None and re.match(r"#{1,6}\s", line):
+                yield title, lines
+                title, lines = line.strip("# "), []
+            lines.append(line)
+
+        yield title, lines
+
+    def extract_sections(self) -> List[DocumentChunk]:
+        """Extract one chunk per heading section."""
+        chunks = []
+
+        for title, lines in self.iter_sections():
+            section = "\n".join(lines).strip()
+            if not section:
+                continue
+
+            title = title or section.split("\n")[0].strip("# ")
+            for part in self.split_large_section(section):
+                chunks.append(DocumentChunk(title=title, content=part))
+        return chunks
+
+
+@register_chunker(".rst", mime_types=("text/x-rst",))
+class RstChunker(MarkdownChunker):
+    """reStructuredText chunker splitting on underlined titles"""
+
+    underline = re.compile(r"([=\-`:'\"~^_*+#<>.])\1{2,}\s*$")
+
+    def is_title(self, line: str, next_line: str) -> bool:
+        """Whether a line is a section title underlined by the next one."""
+        return (
+            bool(line.strip())
+            and not line[0].isspace()
+            and not self.underline.match(line)
+            and bool(self.underline.match(next_line))
+            and len(next_line.rstrip()) >= len(line.rstrip())
+        )
+
+    def iter_sections(self) -> Iterator[Tuple[str, List[str]]]:
+        """Yield the title and lines of each underlined section."""
+        all_lines = self.content.split("\n")
+        title, lines = "", []
+        i = 0
+
+        while i < len(all_lines):
+            line = all_lines[i]
+            next_line = all_lines[i + 1] if i + 1 < len(all_lines) else ""
+            if self.is_title(line, next_line):
+                # Move a matching overline into the new section
+                overline = []
+                if lines and lines[-1].rstrip() == next_line.rstrip():
+                    overline = [lines.pop()]
+                yield title, lines
+                title, lines = line.strip(), overline + [line, next_line]
+                i += 2
+                continue
+            lines.append(line)
+            i += 1
+
+        yield title, lines
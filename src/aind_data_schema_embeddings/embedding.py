@@ -1,16 +1,23 @@
 """Embedding data scehma repository into DocDB"""
 
-import json
+import argparse
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 from sentence_transformers import SentenceTransformer
 
-from aind_data_schema_embeddings.code_chunker import PythonCodeChunker
-from aind_data_schema_embeddings.doc_chunker import DocumentChunker
-from aind_data_schema_embeddings.json_chunker import JSONChunker
+# Chunker modules register themselves with the chunker registry on import
+from aind_data_schema_embeddings import (  # noqa: F401
+    code_chunker,
+    doc_chunker,
+    json_chunker,
+    yaml_chunker,
+)
+from aind_data_schema_embeddings.checkpoint import CheckpointJournal
+from aind_data_schema_embeddings.ingestion import files_to_embed, ingest
 from aind_data_schema_embeddings.utils import ResourceManager
 
 
@@ -28,9 +35,14 @@ file_dir = [data_schema_src_path,
             data_schema_read_the_docs_path]
 
 db_name = "metadata_vector_index"
-collection = "aind_data_schema_vectors"
+collection_name = "aind_data_schema_vectors"
 index_name = "vector_embeddings_index"
 # vectors stored in vector_embeddings
+batch_size = 32
+# Fixed location so runs from any working directory share one journal
+journal_path = (
+    Path.home() / ".aind_data_schema_embeddings" / "ingestion_journal.jsonl"
+)
 
 os.makedirs("logs", exist_ok=True)
 logging.basicConfig(
@@ -46,12 +58,6 @@ model = SentenceTransformer(
 )
 
 
-def class_to_text(class_instance):
-    """Transforms class object to python dictionary"""
-
-    return json.dumps(class_instance.__dict__)
-
-
 def generate_embeddings_for_batch(batch: list) -> dict:
     """Generates embeddings vectors for a batch of loaded documents"""
     docs_embeddings = model.encode(batch)
@@ -62,80 +68,48 @@ def generate_embeddings_for_batch(batch: list) -> dict:
     return text_and_vector_list
 
 
-def write_embeddings_to_docdb_for_batch(
-    file_name: str, collection, text_and_vector_list: list
-) -> None:
-    """Writes vectors into DocDB in batches"""
-
-    for text, vector in text_and_vector_list:
-        document = {
-            "file_name": file_name,
-            "text": text,
-            "vector_embeddings": vector,
-        }
-        try:
-            result = collection.insert_one(document)
-            logging.info(f"Inserted document with ID: {result.inserted_id}")
-        except Exception as e:
-            logging.error(f"Error inserting document: {e}")
-
+def main(args: Optional[List[str]] = None) -> None:
+    """Runs or resumes ingestion of the data schema repository"""
 
-def chunk_maker(file_name: str, file_path: str):
-    """Creating chunks based on file type"""
-
-    if ".py" in file_name:
-        logging.info("Code Chunker initialized")
-        code_chunker = PythonCodeChunker(
-            file_path=str(file_path), file_name=file_name
-        )
-        logging.info("Creating chunks...")
-        chunks = code_chunker.create_chunks()
-
-    if ".txt" in file_name:
-        logging.info("Document Chunker initialized")
-        doc_chunker = DocumentChunker(
-            file_path=str(file_path), file_name=file_name
-        )
-        logging.info("Creating chunks...")
-        chunks = doc_chunker.create_chunks()
-        chunks = [class_to_text(chunk) for chunk in chunks]
-
-    if ".json" in file_name:
-        logging.info("JSON Chunker initialized")
-        doc_chunker = DocumentChunker(
-            file_path=str(file_path), file_name=file_name
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "resume"],
+        default="run",
+        help="run embeds every file not yet complete, "
+        "resume only finishes files left incomplete by earlier runs",
+    )
+    parser.add_argument("--journal", type=Path, default=journal_path)
+    parsed_args = parser.parse_args(args)
+
+    journal = CheckpointJournal(parsed_args.journal)
+
+    with ResourceManager() as RM:
+
+        collection = RM.client[db_name][collection_name]
+
+        if parsed_args.command == "resume":
+            files = [
+                (checkpoint.file_key, Path(checkpoint.file_path))
+                for checkpoint in journal.incomplete_files()
+            ]
+            logging.info(f"Resuming {len(files)} incomplete files")
+        else:
+            logging.info("Going through directory")
+            files = files_to_embed(file_dir, journal)
+
+        summary = ingest(
+            files,
+            collection,
+            journal,
+            embed_batch=generate_embeddings_for_batch,
+            batch_size=batch_size,
         )
-        logging.info("Creating chunks...")
-        chunks = JSONChunker.create_chunks()
-        #chunks = [class_to_text(chunk) for chunk in chunks]
-    return chunks
-
 
-with ResourceManager() as RM:
+    logging.info(summary.report())
+    print(summary.report())
 
-    collection = RM.client[db_name][collection]
 
-    logging.info("Finding files that have already been embedded")
-    embedded_files = set(
-        [asset["file_name"] for asset in collection.find({}, {"file_name": 1})]
-    )
-    logging.info(f"Files already embedded: {embedded_files}")
-
-    logging.info("Going through directory")
-    for file_path in (f for path in file_dir for f in path.rglob("*")):
-        if file_path.is_file() and file_path.name not in embedded_files:
-
-            logging.info(f"Processing file: {file_path}")
-            file_name = file_path.name
-
-            try:
-                chunks = chunk_maker(file_name, file_path)
-                logging.info("Vectorizing chunks")
-                text_and_vector_list = generate_embeddings_for_batch(chunks)
-                logging.info("Adding to vectorstore...")
-                write_embeddings_to_docdb_for_batch(
-                    file_name, collection, text_and_vector_list
-                )
-
-            except Exception as e:
-                logging.error(f"Error processing file {file_path}: {e}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Checkpointed ingestion of chunked files into the vector collection"""
+
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Tuple, Type
+
+from aind_data_schema_embeddings.checkpoint import (
+    CheckpointJournal,
+    RunSummary,
+)
+from aind_data_schema_embeddings.chunker import Chunker, get_chunker
+
+EmbedBatch = Callable[[List[str]], List[Tuple[str, list]]]
+
+
+def batched(chunks: Iterable[str], size: int) -> Iterator[list]:
+    """Groups a stream of chunks into lists of at most size chunks"""
+
+    chunks = iter(chunks)
+    while batch := list(islice(chunks, size)):
+        yield batch
+
+
+def get_file_key(root: Path, file_path: Path) -> str:
+    """Identifies a file by its path relative to its source directory"""
+
+    return (Path(root.name) / file_path.relative_to(root)).as_posix()
+
+
+def get_fingerprint(file_path: Path, chunker_class: Type[Chunker]) -> str:
+    """Detects edits to a file or its chunker between runs"""
+
+    stat = Path(file_path).stat()
+    return (
+        f"{stat.st_size}:{stat.st_mtime_ns}:"
+        f"{chunker_class.__name__}:{chunker_class.version}"
+    )
+
+
+def write_embeddings_to_docdb_for_batch(
+    file_key: str,
+    file_name: str,
+    collection,
+    text_and_vector_list: list,
+    start_index: int,
+) -> int:
+    """Writes vectors into DocDB in batches, stopping at the first failure"""
+
+    documents = [
+        {
+            "file_key": file_key,
+            "file_name": file_name,
+            "chunk_index": chunk_index,
+            "text": text,
+            "vector_embeddings": vector,
+        }
+        for chunk_index, (text, vector) in enumerate(
+            text_and_vector_list, start=start_index
+        )
+    ]
+    result = collection.insert_many(documents, ordered=True)
+    logging.info(f"Inserted {len(result.inserted_ids)} documents")
+    return len(result.inserted_ids)
+
+
+def chunk_maker(
+    chunker_class: Type[Chunker], file_name: str, file_path: Path
+) -> Iterator[str]:
+    """Lazily creating chunks based on file type"""
+
+    logging.info(f"{chunker_class.__name__} initialized")
+    chunker = chunker_class(file_path=str(file_path), file_name=file_name)
+    return chunker.iter_chunks()
+
+
+def embed_file(
+    file_key: str,
+    file_path: Path,
+    collection,
+    journal: CheckpointJournal,
+    summary: RunSummary,
+    embed_batch: EmbedBatch,
+    batch_size: int,
+) -> None:
+    """Embeds a file, resuming from its checkpoint if it has one"""
+
+    file_name = file_path.name
+    chunker_class = get_chunker(file_path)
+    if chunker_class is None:
+        logging.info(f"Skipping unsupported file: {file_path}")
+        summary.skipped_files += 1
+        return
+
+    checkpoint = journal.start_file(
+        file_key, file_path, get_fingerprint(file_path, chunker_class)
+    )
+    resumed = checkpoint.vectors_written > 0
+    if resumed:
+        logging.info(
+            f"Resuming {file_key} after {checkpoint.vectors_written} vectors"
+        )
+        summary.reused_batches += checkpoint.batches_written
+    else:
+        # Vectors stored without a file_key predate checkpointing, so the
+        # file is re-embedded rather than trusting them to be complete
+        collection.delete_many(
+            {"file_name": file_name, "file_key": {"$exists": False}}
+        )
+    # Drop vectors that were never confirmed written, or every vector of
+    # the file if it is starting fresh
+    collection.delete_many(
+        {
+            "file_key": file_key,
+            "chunk_index": {"$gte": checkpoint.vectors_written},
+        }
+    )
+
+    chunks = chunk_maker(chunker_class, file_name, file_path)
+    for batch in batched(
+        islice(chunks, checkpoint.vectors_written, None), batch_size
+    ):
+        logging.info("Vectorizing chunks")
+        text_and_vector_list = embed_batch(batch)
+        logging.info("Adding to vectorstore...")
+        vectors_written = write_embeddings_to_docdb_for_batch(
+            file_key,
+            file_name,
+            collection,
+            text_and_vector_list,
+            start_index=checkpoint.vectors_written,
+        )
+        if vectors_written != len(batch):
+            raise RuntimeError(
+                f"Only {vectors_written} of {len(batch)} vectors written"
+            )
+        journal.record_batch(file_key, vectors_written)
+        summary.record_batch(resumed, vectors_written)
+
+    journal.complete_file(file_key)
+    if resumed:
+        summary.resumed_files += 1
+    else:
+        summary.fresh_files += 1
+
+
+def files_to_embed(
+    roots: Iterable[Path], journal: CheckpointJournal
+) -> Iterator[Tuple[str, Path]]:
+    """Keys and paths of source files that are not fully embedded"""
+
+    for root in roots:
+        for file_path in root.rglob("*"):
+            if not file_path.is_file():
+                continue
+            file_key = get_file_key(root, file_path)
+            checkpoint = journal.get(file_key)
+            if checkpoint is None or not checkpoint.is_complete:
+                yield file_key, file_path
+
+
+def ingest(
+    files: Iterable[Tuple[str, Path]],
+    collection,
+    journal: CheckpointJournal,
+    embed_batch: EmbedBatch,
+    batch_size: int = 32,
+) -> RunSummary:
+    """Embeds files into the vector collection, checkpointing each batch"""
+
+    summary = RunSummary()
+    for file_key, file_path in files:
+        logging.info(f"Processing file: {file_path}")
+        try:
+            embed_file(
+                file_key,
+                file_path,
+                collection,
+                journal,
+                summary,
+                embed_batch,
+                batch_size,
+            )
+        except Exception as e:
+            logging.error(f"Error processing file {file_path}: {e}")
+            journal.fail_file(file_key, e)
+            summary.failed_files += 1
+    return summary
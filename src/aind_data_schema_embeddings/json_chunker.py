@@ -1,12 +1,19 @@
 """Document chunker that preserves JSON nesting"""
 
 import json
+from typing import Iterator, List
 
 from langchain_text_splitters import RecursiveJsonSplitter
 
+from aind_data_schema_embeddings.chunker import register_chunker
+
+
+@register_chunker(".json", mime_types=("application/json",))
 class JSONChunker:
     """Document chunker class"""
 
+    version = 1
+
     def __init__(self, file_path: str, file_name: str):
         """Constructor"""
         with open(file_path) as file:
@@ -18,9 +25,11 @@ class JSONChunker:
             )
         self.chunks = []
 
-    def create_chunks(self):
+    def iter_chunks(self) -> Iterator[str]:
+        """Lazily yield chunks from document."""
+        yield from self.splitter.split_text(json_data=self.content)
+
+    def create_chunks(self) -> List[str]:
         """Create all chunks from document."""
-        str_chunks = self.splitter.split_text(json_data=self.content)
-        self.chunks.extend(str_chunks)
+        self.chunks.extend(self.iter_chunks())
         return self.chunks
-
@@ -63,7 +63,7 @@ class ResourceManager:
             self.__exit__()
             raise
 
-    def __exit__(self):
+    def __exit__(self, *exc_info):
         """Closes ssh tunnel"""
         if self.client:
             self.client.close()
@@ -0,0 +1,103 @@
+"""Document chunker that keeps top-level YAML blocks together"""
+
+import re
+from typing import Iterator, List
+
+from aind_data_schema_embeddings.chunker import register_chunker
+
+
+@register_chunker(
+    ".yaml", ".yml", mime_types=("application/yaml", "application/x-yaml")
+)
+class YAMLChunker:
+    """Document chunker class"""
+
+    version = 1
+
+    def __init__(self, file_path: str, file_name: str):
+        """Constructor"""
+        with open(file_path, "r", encoding="utf-8") as file:
+            self.content = file.read()
+        self.max_chunk_size = 8192
+        self.file_name = file_name
+        self.chunks = []
+
+    def is_block_start(
+        self, line: str, has_content: bool, is_list: bool
+    ) -> bool:
+        """Whether a line starts a new top-level key or sequence item."""
+        if not has_content:
+            # Leading comments stay with the block they introduce
+            return False
+        if re.match(r"-(\s|$)", line):
+            # Sequence items only start a block within a top-level list,
+            # otherwise they belong to the key above them
+            return is_list
+        return bool(re.match(r"[^\s#]", line))
+
+    def iter_blocks(self) -> Iterator[str]:
+        """Yield each top-level key, sequence item or document."""
+        block = []
+        has_content = False
+        is_list = None
+        for line in self.content.splitlines():
+            if line.strip() == "---":
+                if has_content:
+                    yield "\n".join(block)
+                block, has_content, is_list = [], False, None
+                continue
+            is_content = bool(re.match(r"\s*[^\s#]", line))
+            if is_list is None and is_content:
+                # The first content line decides if the document is a list
+                is_list = bool(re.match(r"-(\s|$)", line))
+            if is_content and self.is_block_start(line, has_content, is_list):
+                yield "\n".join(block)
+                block, has_content = [], False
+            block.append(line)
+            has_content = has_content or is_content
+
+        if has_content:
+            yield "\n".join(block)
+
+    def split_large_block(self, block: str) -> Iterator[str]:
+        """Split an oversized block on line boundaries."""
+        current = ""
+        for line in block.split("\n"):
+            while len(line) > self.max_chunk_size:
+                if current:
+                    yield current
+                    current = ""
+                yield line[: self.max_chunk_size]
+                line = line[self.max_chunk_size :]
+            if current and len(current) + len(line) + 1 > self.max_chunk_size:
+                yield current
+                current = line
+            else:
+                current = f"{current}\n{line}" if current else line
+        if current:
+            yield current
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Lazily yield chunks from document."""
+        current_chunk = ""
+        for block in self.iter_blocks():
+            for part in self.split_large_block(block):
+                if (
+                    current_chunk
+                    and len(current_chunk) + len(part) + 1
+                    > self.max_chunk_size
+                ):
+                    yield current_chunk
+                    current_chunk = part
+                else:
+                    current_chunk = (
+                        f"{current_chunk}\n{part}" if current_chunk else part
+                    )
+
+        if current_chunk:
+            yield current_chunk
+
+    def create_chunks(self) -> List[str]:
+        """Create all chunks from document."""
+        self.chunks.extend(self.iter_chunks())
+        return self.chunks
@@ -0,0 +1,107 @@
+"""Tests for the ingestion checkpoint journal."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from aind_data_schema_embeddings.checkpoint import (
+    COMPLETED,
+    FAILED,
+    CheckpointJournal,
+    RunSummary,
+)
+
+
+class CheckpointJournalTest(unittest.TestCase):
+    """Tests for recording and replaying checkpoints"""
+
+    def setUp(self):
+        """Create a scratch journal path"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_path = Path(self.tmp_dir.name) / "logs" / "journal.jsonl"
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        self.tmp_dir.cleanup()
+
+    def test_replay_resumes_confirmed_progress(self):
+        """Tests that a new journal picks up where the last one stopped"""
+        journal = CheckpointJournal(self.journal_path)
+        journal.start_file("src/a.py", "/src/a.py", "1:1")
+        journal.record_batch("src/a.py", 32)
+        journal.record_batch("src/a.py", 5)
+        journal.start_file("src/b.py", "/src/b.py", "1:1")
+        journal.complete_file("src/b.py")
+
+        replayed = CheckpointJournal(self.journal_path)
+        checkpoint = replayed.get("src/a.py")
+        self.assertEqual(checkpoint.batches_written, 2)
+        self.assertEqual(checkpoint.vectors_written, 37)
+        self.assertEqual(replayed.get("src/b.py").stage, COMPLETED)
+        self.assertEqual(
+            [cp.file_key for cp in replayed.incomplete_files()], ["src/a.py"]
+        )
+
+        resumed = replayed.start_file("src/a.py", "/src/a.py", "1:1")
+        self.assertEqual(resumed.vectors_written, 37)
+
+    def test_failure_keeps_progress(self):
+        """Tests that failing a file keeps its confirmed vector count"""
+        journal = CheckpointJournal(self.journal_path)
+        journal.fail_file("unknown.py", ValueError("never started"))
+        self.assertIsNone(journal.get("unknown.py"))
+
+        journal.start_file("src/a.py", "/src/a.py", "1:1")
+        journal.record_batch("src/a.py", 32)
+        journal.fail_file("src/a.py", ConnectionError("tunnel dropped"))
+
+        checkpoint = CheckpointJournal(self.journal_path).get("src/a.py")
+        self.assertEqual(checkpoint.stage, FAILED)
+        self.assertEqual(checkpoint.vectors_written, 32)
+
+    def test_torn_record_is_ignored(self):
+        """Tests that a partially written final record is skipped"""
+        journal = CheckpointJournal(self.journal_path)
+        journal.start_file("src/a.py", "/src/a.py", "1:1")
+        journal.record_batch("src/a.py", 32)
+        with open(self.journal_path, "a") as file:
+            file.write('{"file_key": "src/a.py", "sta')
+
+        with self.assertLogs(level="WARNING"):
+            replayed = CheckpointJournal(self.journal_path)
+        self.assertEqual(replayed.get("src/a.py").vectors_written, 32)
+
+        # The next record must not be swallowed by the torn one
+        replayed.record_batch("src/a.py", 8)
+        checkpoint = CheckpointJournal(self.journal_path).get("src/a.py")
+        self.assertEqual(checkpoint.vectors_written, 40)
+
+    def test_changed_file_restarts(self):
+        """Tests that a changed fingerprint resets confirmed progress"""
+        journal = CheckpointJournal(self.journal_path)
+        journal.start_file("src/a.py", "/src/a.py", "1:1")
+        journal.record_batch("src/a.py", 32)
+
+        checkpoint = journal.start_file("src/a.py", "/src/a.py", "2:2")
+        self.assertEqual(checkpoint.batches_written, 0)
+        self.assertEqual(checkpoint.vectors_written, 0)
+
+
+class RunSummaryTest(unittest.TestCase):
+    """Tests for the run summary"""
+
+    def test_report(self):
+        """Tests that resumed and fresh batches are reported separately"""
+        summary = RunSummary(fresh_files=1, resumed_files=1, reused_batches=3)
+        summary.record_batch(resumed=True, vectors_written=32)
+        summary.record_batch(resumed=False, vectors_written=10)
+        self.assertEqual(
+            summary.report(),
+            "Files: 1 fresh, 1 resumed, 0 skipped, 0 failed. "
+            "Batches: 1 fresh, 1 resumed, 3 reused from checkpoints. "
+            "Vectors written: 42",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Tests for the chunker registry and streaming chunkers."""
+
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+from aind_data_schema_embeddings.chunker import get_chunker, is_binary
+from aind_data_schema_embeddings.code_chunker import PythonCodeChunker
+from aind_data_schema_embeddings.doc_chunker import (
+    DocumentChunker,
+    MarkdownChunker,
+    RstChunker,
+)
+from aind_data_schema_embeddings.yaml_chunker import YAMLChunker
+
+
+class ChunkerRegistryTest(unittest.TestCase):
+    """Tests for looking up chunkers by file suffix"""
+
+    def setUp(self):
+        """Create a scratch directory"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        self.tmp_dir.cleanup()
+
+    def write(self, name: str, content: bytes) -> Path:
+        """Write a scratch file"""
+        path = self.root / name
+        path.write_bytes(content)
+        return path
+
+    def test_suffix_lookup(self):
+        """Tests that chunkers are found by exact suffix"""
+        self.assertIs(
+            get_chunker(self.write("a.py", b"x = 1\n")), PythonCodeChunker
+        )
+        self.assertIs(
+            get_chunker(self.write("a.txt", b"Title\n")), DocumentChunker
+        )
+        self.assertIs(
+            get_chunker(self.write("a.rst", b"Title\n")), RstChunker
+        )
+        self.assertIs(
+            get_chunker(self.write("a.md", b"# T\n")), MarkdownChunker
+        )
+        self.assertIs(
+            get_chunker(self.write("a.yml", b"a: 1\n")), YAMLChunker
+        )
+
+    def test_unsupported_files_are_skipped(self):
+        """Tests that lookalike suffixes and binaries are skipped"""
+        self.assertIsNone(get_chunker(self.write("a.pyc", b"x = 1\n")))
+        self.assertIsNone(get_chunker(self.write("a.json.bak", b"{}")))
+        self.assertIsNone(get_chunker(self.write("a.py", b"\x00\x01\x02")))
+
+    def test_is_binary(self):
+        """Tests binary sniffing"""
+        self.assertTrue(is_binary(self.write("a", b"\xff\xfe\x00")))
+        self.assertFalse(is_binary(self.write("b", "µm\n".encode())))
+        self.assertTrue(is_binary(self.write("c", "café".encode("latin-1"))))
+        # A character cut off at the end of the sniff window is not binary
+        cut_off = ("a" * 1023 + "µ").encode()
+        self.assertFalse(is_binary(self.write("d", cut_off)))
+
+
+class StreamingChunkerTest(unittest.TestCase):
+    """Tests that chunkers yield their chunks lazily"""
+
+    def setUp(self):
+        """Create a scratch directory"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        self.tmp_dir.cleanup()
+
+    def chunker(self, chunker_class, name: str, content: str):
+        """Build a chunker over a scratch file"""
+        path = self.root / name
+        path.write_text(content)
+        return chunker_class(file_path=str(path), file_name=name)
+
+    def test_code_chunker(self):
+        """Tests that code chunks are streamed and match create_chunks"""
+        chunker = self.chunker(
+            PythonCodeChunker, "a.py", "import os\n\ndef f():\n    pass\n"
+        )
+        chunks = chunker.iter_chunks()
+        self.assertIsInstance(chunks, types.GeneratorType)
+        self.assertEqual(list(chunks), chunker.create_chunks())
+
+    def test_markdown_chunker(self):
+        """Tests that Markdown is split on headings"""
+        chunker = self.chunker(
+            MarkdownChunker, "a.md", "# One\ntext\n\n## Two\nmore\n"
+        )
+        titles = [chunk.title for chunk in chunker.create_chunks()]
+        self.assertEqual(titles, ["One", "Two"])
+
+    def test_markdown_chunker_keeps_small_sections_apart(self):
+        """Tests that small sections are not merged across headings"""
+        chunker = self.chunker(
+            MarkdownChunker, "a.md", "# A\na\n\n# B\nb\n\n# C\nc"
+        )
+        chunks = chunker.create_chunks()
+        self.assertEqual([chunk.title for chunk in chunks], ["A", "B", "C"])
+        self.assertEqual(chunks[1].content, "# B\nb")
+
+    def test_markdown_chunker_ignores_fenced_comments(self):
+        """Tests that comments inside code fences are not headings"""
+        chunker = self.chunker(
+            MarkdownChunker,
+            "a.md",
+            "# Install\n\n```bash\n# create env\nconda create\n"
+            "# activate\nconda activate\n```\n\n# Usage\nrun it\n",
+        )
+        chunks = chunker.create_chunks()
+        self.assertEqual(
+            [chunk.title for chunk in chunks], ["Install", "Usage"]
+        )
+        self.assertIn("# activate\nconda activate\n```", chunks[0].content)
+
+    def test_rst_chunker(self):
+        """Tests that reStructuredText is split on underlined titles"""
+        chunker = self.chunker(
+            RstChunker,
+            "a.rst",
+            "=====\nIntro\n=====\n\nSome intro text.\n\n"
+            "Usage\n-----\n\nUse it like this.\n",
+        )
+        chunks = chunker.create_chunks()
+        self.assertEqual([chunk.title for chunk in chunks], ["Intro", "Usage"])
+        self.assertTrue(chunks[0].content.startswith("=====\nIntro"))
+        self.assertNotIn("Usage", chunks[0].content)
+
+    def test_yaml_chunker(self):
+        """Tests that YAML is split on top-level keys"""
+        chunker = self.chunker(
+            YAMLChunker, "a.yaml", "a:\n  b: 1\n---\nc:\n- 2\n"
+        )
+        self.assertEqual(
+            list(chunker.iter_blocks()), ["a:\n  b: 1", "c:\n- 2"]
+        )
+
+    def test_yaml_chunker_splits_top_level_lists(self):
+        """Tests that a large top-level list is kept under the size limit"""
+        content = "".join(f"- name: item_{i}\n  v: {i}\n" for i in range(2000))
+        chunker = self.chunker(YAMLChunker, "a.yaml", content)
+        self.assertEqual(len(list(chunker.iter_blocks())), 2000)
+        chunks = chunker.create_chunks()
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(
+            all(len(chunk) <= chunker.max_chunk_size for chunk in chunks)
+        )
+
+        chunker.max_chunk_size = 10
+        self.assertTrue(
+            all(len(chunk) <= 10 for chunk in chunker.iter_chunks())
+        )
+
+    def test_yaml_chunker_list_after_comment(self):
+        """Tests that a list is detected past leading comments"""
+        chunker = self.chunker(
+            YAMLChunker, "a.yaml", "# header\n\n- a\n# note\n- b\n"
+        )
+        self.assertEqual(
+            list(chunker.iter_blocks()), ["# header\n\n- a\n# note", "- b"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,281 @@
+"""Tests for checkpointed, resumable ingestion."""
+
+import tempfile
+import types
+import unittest
+from unittest import mock
+from pathlib import Path
+
+from aind_data_schema_embeddings.yaml_chunker import YAMLChunker
+from aind_data_schema_embeddings.checkpoint import CheckpointJournal
+from aind_data_schema_embeddings.ingestion import (
+    files_to_embed,
+    get_file_key,
+    ingest,
+)
+
+
+class FakeCollection:
+    """In-memory stand-in for the vector collection"""
+
+    def __init__(self, fail_on_insert: int = None):
+        """Constructor"""
+        self.documents = []
+        self.inserts = 0
+        self.fail_on_insert = fail_on_insert
+
+    @staticmethod
+    def matches(document: dict, query: dict) -> bool:
+        """Whether a document matches a simple query"""
+        for key, value in query.items():
+            if not isinstance(value, dict):
+                if document.get(key) != value:
+                    return False
+            elif "$exists" in value and (key in document) != value["$exists"]:
+                return False
+            elif "$gte" in value and document.get(key, -1) < value["$gte"]:
+                return False
+        return True
+
+    def insert_many(self, documents: list, ordered: bool):
+        """Store documents in order, stopping at the configured insert"""
+        inserted_ids = []
+        for document in documents:
+            self.inserts += 1
+            if self.inserts == self.fail_on_insert:
+                raise ConnectionError("tunnel dropped")
+            self.documents.append(document)
+            inserted_ids.append(len(self.documents))
+        return types.SimpleNamespace(inserted_ids=inserted_ids)
+
+    def delete_many(self, query: dict):
+        """Delete the documents matching a query"""
+        self.documents = [
+            document
+            for document in self.documents
+            if not self.matches(document, query)
+        ]
+
+    def chunk_indexes(self, file_key: str) -> list:
+        """Stored chunk indexes of a file"""
+        return sorted(
+            document["chunk_index"]
+            for document in self.documents
+            if document.get("file_key") == file_key
+        )
+
+
+class FakeEncoder:
+    """Records every chunk it is asked to encode"""
+
+    def __init__(self):
+        """Constructor"""
+        self.encoded = []
+
+    def __call__(self, batch: list) -> list:
+        """Return a dummy vector for each chunk"""
+        self.encoded.extend(batch)
+        return [(text, [0.0]) for text in batch]
+
+
+class IngestionTest(unittest.TestCase):
+    """Tests for crashing and resuming ingestion"""
+
+    def setUp(self):
+        """Create source directories and a scratch journal"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp = Path(self.tmp_dir.name)
+        self.root = self.tmp / "schemas"
+        (self.root / "a").mkdir(parents=True)
+        (self.root / "b").mkdir()
+        self.journal_path = self.tmp / "journal.jsonl"
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        self.tmp_dir.cleanup()
+
+    def write_yaml(self, path: Path, fill: str = "x", width=5000) -> list:
+        """Write a YAML file with one chunk per top-level key"""
+        blocks = [f"key_{i}: {fill * width}" for i in range(10)]
+        path.write_text("\n".join(blocks) + "\n")
+        return blocks
+
+    def test_resume_after_crash(self):
+        """Tests that completed batches are not re-encoded on resume"""
+        path = self.root / "a" / "config.yaml"
+        blocks = self.write_yaml(path)
+        file_key = get_file_key(self.root, path)
+
+        # Crash partway through the third batch of two chunks
+        collection = FakeCollection(fail_on_insert=6)
+        encoder = FakeEncoder()
+        summary = ingest(
+            [(file_key, path)],
+            collection,
+            CheckpointJournal(self.journal_path),
+            encoder,
+            batch_size=2,
+        )
+        self.assertEqual(summary.failed_files, 1)
+        self.assertEqual(summary.fresh_files, 0)
+        self.assertEqual(collection.chunk_indexes(file_key), [0, 1, 2, 3, 4])
+
+        journal = CheckpointJournal(self.journal_path)
+        self.assertEqual(journal.get(file_key).vectors_written, 4)
+
+        collection.fail_on_insert = None
+        encoder = FakeEncoder()
+        summary = ingest(
+            [
+                (checkpoint.file_key, Path(checkpoint.file_path))
+                for checkpoint in journal.incomplete_files()
+            ],
+            collection,
+            journal,
+            encoder,
+            batch_size=2,
+        )
+
+        self.assertEqual(encoder.encoded, blocks[4:])
+        self.assertEqual(collection.chunk_indexes(file_key), list(range(10)))
+        self.assertEqual(summary.resumed_files, 1)
+        self.assertEqual(summary.reused_batches, 2)
+        self.assertEqual(summary.resumed_batches, 3)
+        self.assertTrue(journal.get(file_key).is_complete)
+
+    def test_changed_file_restarts_from_first_chunk(self):
+        """Tests that a file edited after a crash is fully re-embedded"""
+        path = self.root / "a" / "config.yaml"
+        self.write_yaml(path)
+        file_key = get_file_key(self.root, path)
+
+        collection = FakeCollection(fail_on_insert=6)
+        ingest(
+            [(file_key, path)],
+            collection,
+            CheckpointJournal(self.journal_path),
+            FakeEncoder(),
+            batch_size=2,
+        )
+
+        blocks = self.write_yaml(path, fill="y", width=5001)
+        collection.fail_on_insert = None
+        encoder = FakeEncoder()
+        summary = ingest(
+            [(file_key, path)],
+            collection,
+            CheckpointJournal(self.journal_path),
+            encoder,
+            batch_size=2,
+        )
+
+        self.assertEqual(encoder.encoded, blocks)
+        self.assertEqual(collection.chunk_indexes(file_key), list(range(10)))
+        stored = sorted(
+            collection.documents, key=lambda document: document["chunk_index"]
+        )
+        self.assertEqual([document["text"] for document in stored], blocks)
+        self.assertEqual(summary.fresh_files, 1)
+        self.assertEqual(summary.resumed_files, 0)
+        self.assertEqual(summary.fresh_batches, 5)
+        self.assertEqual(summary.resumed_batches, 0)
+
+    def test_changed_chunker_restarts_from_first_chunk(self):
+        """Tests that a new chunker version discards old checkpoints"""
+        path = self.root / "a" / "config.yaml"
+        blocks = self.write_yaml(path)
+        file_key = get_file_key(self.root, path)
+
+        collection = FakeCollection(fail_on_insert=6)
+        ingest(
+            [(file_key, path)],
+            collection,
+            CheckpointJournal(self.journal_path),
+            FakeEncoder(),
+            batch_size=2,
+        )
+
+        collection.fail_on_insert = None
+        encoder = FakeEncoder()
+        with mock.patch.object(YAMLChunker, "version", 2):
+            ingest(
+                [(file_key, path)],
+                collection,
+                CheckpointJournal(self.journal_path),
+                encoder,
+                batch_size=2,
+            )
+
+        self.assertEqual(encoder.encoded, blocks)
+        self.assertEqual(collection.chunk_indexes(file_key), list(range(10)))
+
+    def test_batch_stops_at_first_failed_insert(self):
+        """Tests that a failed insert aborts the rest of its batch"""
+        path = self.root / "a" / "config.yaml"
+        self.write_yaml(path)
+        file_key = get_file_key(self.root, path)
+
+        collection = FakeCollection(fail_on_insert=2)
+        journal = CheckpointJournal(self.journal_path)
+        summary = ingest(
+            [(file_key, path)], collection, journal, FakeEncoder(), 4
+        )
+
+        self.assertEqual(collection.inserts, 2)
+        self.assertEqual(collection.chunk_indexes(file_key), [0])
+        self.assertEqual(journal.get(file_key).vectors_written, 0)
+        self.assertEqual(summary.failed_files, 1)
+
+    def test_rerun_without_journal_is_idempotent(self):
+        """Tests that losing the journal does not duplicate vectors"""
+        path = self.root / "a" / "config.yaml"
+        self.write_yaml(path)
+        file_key = get_file_key(self.root, path)
+
+        collection = FakeCollection()
+        for journal_name in ("first.jsonl", "second.jsonl"):
+            ingest(
+                [(file_key, path)],
+                collection,
+                CheckpointJournal(self.tmp / journal_name),
+                FakeEncoder(),
+                batch_size=2,
+            )
+
+        self.assertEqual(collection.chunk_indexes(file_key), list(range(10)))
+
+    def test_same_file_names_are_kept_apart(self):
+        """Tests that files sharing a name have separate checkpoints"""
+        for directory in ("a", "b"):
+            self.write_yaml(self.root / directory / "config.yaml")
+
+        journal = CheckpointJournal(self.journal_path)
+        files = list(files_to_embed([self.root], journal))
+        self.assertEqual(
+            sorted(file_key for file_key, _ in files),
+            ["schemas/a/config.yaml", "schemas/b/config.yaml"],
+        )
+
+        # Vectors stored before checkpointing are replaced, not trusted
+        collection = FakeCollection()
+        collection.documents.append(
+            {"file_name": "config.yaml", "text": "old", "chunk_index": 0}
+        )
+        summary = ingest(
+            files_to_embed([self.root], journal),
+            collection,
+            journal,
+            FakeEncoder(),
+            batch_size=2,
+        )
+        self.assertEqual(summary.fresh_files, 2)
+        for file_key, _ in files:
+            self.assertEqual(
+                collection.chunk_indexes(file_key), list(range(10))
+            )
+        self.assertEqual(len(collection.documents), 20)
+        self.assertEqual(list(files_to_embed([self.root], journal)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()